@@ -40,8 +40,15 @@ class PatchSampler:
         self,
         subject: Subject,
         index_ini: TypeTripletInt,
+        *,
+        spatial_shape: TypeTripletInt | None = None,
     ) -> Subject:
-        cropped_subject = self.crop(subject, index_ini, self.patch_size)  # type: ignore[arg-type]
+        cropped_subject = self.crop(
+            subject,
+            index_ini,
+            self.patch_size,  # type: ignore[arg-type]
+            spatial_shape=spatial_shape,
+        )
         return cropped_subject
 
     def crop(
@@ -49,15 +56,21 @@ class PatchSampler:
         subject: Subject,
         index_ini: TypeTripletInt,
         patch_size: TypeTripletInt,
+        *,
+        spatial_shape: TypeTripletInt | None = None,
     ) -> Subject:
-        transform = self._get_crop_transform(subject, index_ini, patch_size)
+        transform = self._get_crop_transform(
+            subject,
+            index_ini,
+            patch_size,
+            spatial_shape=spatial_shape,
+        )
         cropped_subject = transform(subject)
         index_ini_array = np.asarray(index_ini)
         patch_size_array = np.asarray(patch_size)
         index_fin = index_ini_array + patch_size_array
         location = index_ini_array.tolist() + index_fin.tolist()
         cropped_subject[LOCATION] = torch.as_tensor(location)
-        cropped_subject.update_attributes()
         return cropped_subject
 
     @staticmethod
@@ -65,10 +78,16 @@ class PatchSampler:
         subject,
         index_ini: TypeTripletInt,
         patch_size: TypeSpatialShape,
+        *,
+        spatial_shape: TypeTripletInt | None = None,
     ):
         from ...transforms.preprocessing.spatial.crop import Crop
 
-        shape = np.array(subject.spatial_shape, dtype=np.uint16)
+        # Callers that have already checked the consistency of the spatial
+        # shapes can pass the shape to skip the check
+        if spatial_shape is None:
+            spatial_shape = subject.spatial_shape
+        shape = np.array(spatial_shape, dtype=np.uint16)
         index_ini_array = np.array(index_ini, dtype=np.uint16)
         patch_size_array = np.array(patch_size, dtype=np.uint16)
         assert len(index_ini_array) == 3
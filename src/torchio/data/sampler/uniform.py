@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from collections.abc import Generator
 
+import numpy as np
 import torch
 
 from ...data.subject import Subject
+from ...types import TypeTripletInt
 from .sampler import RandomSampler
 
 
@@ -15,6 +17,9 @@ class UniformSampler(RandomSampler):
         patch_size: See :class:`~torchio.data.PatchSampler`.
     """
 
+    # Maximum number of patch locations drawn at once
+    chunk_size = 1024
+
     def get_probability_map(self, subject: Subject) -> torch.Tensor:
         return torch.ones(1, *subject.spatial_shape)
 
@@ -23,11 +28,38 @@ class UniformSampler(RandomSampler):
         subject: Subject,
         num_patches: int | None = None,
     ) -> Generator[Subject]:
-        valid_range = subject.spatial_shape - self.patch_size
-        patches_left = num_patches if num_patches is not None else True
-        while patches_left:
-            i, j, k = tuple(int(torch.randint(x + 1, (1,)).item()) for x in valid_range)
-            index_ini = i, j, k
-            yield self.extract_patch(subject, index_ini)
-            if num_patches is not None:
-                patches_left -= 1
+        # The spatial shapes have been checked in __call__, so the shape is
+        # passed on to skip checking it again for each patch
+        spatial_shape = subject._spatial_shape_unchecked
+        # Computed once as a vector of exclusive upper bounds for the draws
+        high = np.asarray(spatial_shape, dtype=np.int64) - self.patch_size + 1
+        rng = self._get_generator()
+        patches_left = num_patches
+        while patches_left is None or patches_left > 0:
+            if patches_left is None:
+                num_indices = self.chunk_size
+            else:
+                num_indices = min(self.chunk_size, patches_left)
+                patches_left -= num_indices
+            for index_ini in self._sample_indices(rng, high, num_indices):
+                yield self.extract_patch(
+                    subject,
+                    index_ini,
+                    spatial_shape=spatial_shape,
+                )
+
+    @staticmethod
+    def _get_generator() -> np.random.Generator:
+        # Seeded from the PyTorch RNG, so that torch.manual_seed makes sampling
+        # reproducible and each data loader worker samples different patches
+        seed = int(torch.randint(0, 2**31, (1,)).item())
+        return np.random.default_rng(seed)
+
+    @staticmethod
+    def _sample_indices(
+        rng: np.random.Generator,
+        high: np.ndarray,
+        num_indices: int,
+    ) -> list[TypeTripletInt]:
+        indices = rng.integers(0, high, size=(num_indices, 3)).tolist()
+        return [tuple(index) for index in indices]  # type: ignore[misc]
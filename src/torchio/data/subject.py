@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import copy
+import functools
 import pprint
+from collections.abc import Iterable
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from typing import Any
@@ -47,6 +49,11 @@ class Subject(dict):
         >>> subject = tio.Subject(subject_dict)
     """
 
+    # The cache is stored in a slot so that it is not copied with __dict__,
+    # which holds the attributes exposing the items
+    __slots__ = ('__dict__', '__weakref__', '_images_names_cache')
+    _images_names_cache: tuple[tuple, list[str]] | None
+
     def __init__(self, *args, **kwargs: dict[str, Any]):
         if args:
             if len(args) == 1 and isinstance(args[0], dict):
@@ -55,7 +62,7 @@ class Subject(dict):
                 message = 'Only one dictionary as positional argument is allowed'
                 raise ValueError(message)
         super().__init__(**kwargs)
-        self._parse_images(self.get_images(intensity_only=False))
+        self._parse_images(self.values())
         self.update_attributes()  # this allows me to do e.g. subject.t1
         self.applied_transforms: list[tuple[str, dict]] = []
 
@@ -80,17 +87,99 @@ class Subject(dict):
                     ' same spatial shape'
                 )
                 raise RuntimeError(message) from e
-            copied = copy.deepcopy(self)
-            for image_name, image in copied.items():
-                copied[image_name] = image[item]
-            return copied
+            images = self.get_images_dict(intensity_only=False)
+            cropped_images = {name: image[item] for name, image in images.items()}
+            return self._copy_with_images(cropped_images)
         else:
             return super().__getitem__(item)
 
+    def _copy_with_images(self, images: dict[str, Image]) -> Subject:
+        # Cheaper than deepcopying the subject and overwriting its images, as
+        # only the other items and attributes, which are small, are deepcopied
+        new = self.__class__.__new__(self.__class__)
+        memo: dict[int, Any] = {}
+        for key, value in self.__dict__.items():
+            if key not in images:
+                new.__dict__[key] = copy.deepcopy(value, memo)
+        for key, value in self.items():
+            if key in images:
+                new[key] = images[key]
+            else:
+                new[key] = copy.deepcopy(value, memo)
+        return new
+
+    # Mutating methods are overridden to keep the attributes in sync with the
+    # items and to invalidate the cached image names
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.__dict__[key] = value  # this allows me to do e.g. subject.t1
+        self._clear_images_cache()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.__dict__.pop(key, None)
+        self._clear_images_cache()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.update_attributes()
+        self._clear_images_cache()
+
+    def __ior__(self, other: Any) -> Subject:  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self.__dict__[key] = value
+        self._clear_images_cache()
+        return value
+
+    def pop(self, key, *args):
+        value = super().pop(key, *args)
+        self.__dict__.pop(key, None)
+        self._clear_images_cache()
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.__dict__.pop(key, None)
+        self._clear_images_cache()
+        return key, value
+
+    def clear(self):
+        for key in self:
+            self.__dict__.pop(key, None)
+        super().clear()
+        self._clear_images_cache()
+
+    def _clear_images_cache(self) -> None:
+        self._images_names_cache = None
+
+    def _get_images_names(self, intensity_only: bool) -> list[str]:
+        # The names are cached as this is called for most subject properties.
+        # The keys are stored too, to detect changes made through dict methods
+        # that bypass the ones overridden above
+        keys = tuple(dict.keys(self))
+        cache = getattr(self, '_images_names_cache', None)
+        if cache is None or cache[0] != keys:
+            names = [key for key, value in self.items() if isinstance(value, Image)]
+            cache = keys, names
+            self._images_names_cache = cache
+        names = cache[1]
+        if intensity_only:
+            # The type is not cached, as it can be modified in the image
+            names = [
+                name
+                for name in names
+                if dict.__getitem__(self, name)[TYPE] == INTENSITY
+            ]
+        return names
+
     @staticmethod
-    def _parse_images(images: list[Image]) -> None:
-        # Check that it's not empty
-        if not images:
+    def _parse_images(values: Iterable[Any]) -> None:
+        # Check that there is at least one image, stopping at the first one
+        if not any(isinstance(value, Image) for value in values):
             raise TypeError('A subject without images cannot be created')
 
     @property
@@ -126,6 +215,12 @@ class Subject(dict):
         self.check_consistent_spatial_shape()
         return self.get_first_image().spatial_shape
 
+    @property
+    def _spatial_shape_unchecked(self):
+        # Only for callers that have already checked that all images have the
+        # same spatial shape, e.g. patch samplers
+        return self.get_first_image().spatial_shape
+
     @property
     def spacing(self):
         """Return spacing of first image in subject.
@@ -156,11 +251,14 @@ class Subject(dict):
         image_interpolation: str | None = None,
     ) -> list[Transform]:
         from ..transforms.intensity_transform import IntensityTransform
-        from ..transforms.transform import Transform
 
-        name_to_transform = {cls.__name__: cls for cls in get_subclasses(Transform)}
+        name_to_transform = _get_transform_class_map()
         transforms_list = []
         for transform_name, arguments in self.applied_transforms:
+            if transform_name not in name_to_transform:
+                # The class might have been defined after the map was cached
+                _get_transform_class_map.cache_clear()
+                name_to_transform = _get_transform_class_map()
             transform = name_to_transform[transform_name](**arguments)
             if ignore_intensity and isinstance(transform, IntensityTransform):
                 continue
@@ -264,38 +362,38 @@ class Subject(dict):
             f'More than one value for "{attribute}" found in subject images:\n{{}}'
         )
 
-        names_images = self.get_images_dict(intensity_only=False).items()
+        images = self.get_images_dict(intensity_only=False)
+        if len(images) <= 1:
+            return
+        names_values = [
+            (image_name, getattr(image, attribute))
+            for image_name, image in images.items()
+        ]
         try:
-            first_attribute = None
-            first_image = None
-
-            for image_name, image in names_images:
-                if first_attribute is None:
-                    first_attribute = getattr(image, attribute)
-                    first_image = image_name
-                    continue
-                current_attribute = getattr(image, attribute)
-                all_close = np.allclose(
-                    current_attribute,
-                    first_attribute,
-                    rtol=relative_tolerance,
-                    atol=absolute_tolerance,
+            # Compare all values against the first one in a single call
+            values = np.asarray([value for _, value in names_values])
+            close = np.isclose(
+                values,
+                values[:1],
+                rtol=relative_tolerance,
+                atol=absolute_tolerance,
+            )
+            all_close = close.reshape(len(values), -1).all(axis=1)
+            if not all_close.all():
+                first_image, first_attribute = names_values[0]
+                image_name, current_attribute = names_values[np.argmin(all_close)]
+                message = message.format(
+                    pprint.pformat(
+                        {
+                            first_image: first_attribute,
+                            image_name: current_attribute,
+                        }
+                    ),
                 )
-                if not all_close:
-                    message = message.format(
-                        pprint.pformat(
-                            {
-                                first_image: first_attribute,
-                                image_name: current_attribute,
-                            }
-                        ),
-                    )
-                    raise RuntimeError(message)
+                raise RuntimeError(message)
         except TypeError:
             # fallback for non-numeric values
-            values_dict = {}
-            for image_name, image in names_images:
-                values_dict[image_name] = getattr(image, attribute)
+            values_dict = dict(names_values)
             num_unique_values = len(set(values_dict.values()))
             if num_unique_values > 1:
                 message = message.format(pprint.pformat(values_dict))
@@ -335,16 +433,12 @@ class Subject(dict):
         exclude: Sequence[str] | None = None,
     ) -> dict[str, Image]:
         images = {}
-        for image_name, image in self.items():
-            if not isinstance(image, Image):
-                continue
-            if intensity_only and not image[TYPE] == INTENSITY:
-                continue
+        for image_name in self._get_images_names(intensity_only):
             if include is not None and image_name not in include:
                 continue
             if exclude is not None and image_name in exclude:
                 continue
-            images[image_name] = image
+            images[image_name] = dict.__getitem__(self, image_name)
         return images
 
     def get_images(
@@ -361,7 +455,8 @@ class Subject(dict):
         return list(images_dict.values())
 
     def get_first_image(self) -> Image:
-        return self.get_images(intensity_only=False)[0]
+        first_image_name = self._get_images_names(intensity_only=False)[0]
+        return dict.__getitem__(self, first_image_name)
 
     def add_transform(
         self,
@@ -403,13 +498,11 @@ class Subject(dict):
             raise ValueError(message)
         self._check_image_name(image_name)
         self[image_name] = image
-        self.update_attributes()
 
     def remove_image(self, image_name: str) -> None:
         """Remove an image from the subject instance."""
         self._check_image_name(image_name)
         del self[image_name]
-        delattr(self, image_name)
 
     def plot(self, **kwargs) -> None:
         """Plot images using matplotlib.
@@ -421,3 +514,10 @@ class Subject(dict):
         from ..visualization import plot_subject  # avoid circular import
 
         plot_subject(self, **kwargs)
+
+
+@functools.cache
+def _get_transform_class_map() -> dict[str, type]:
+    from ..transforms.transform import Transform
+
+    return {cls.__name__: cls for cls in get_subclasses(Transform)}
@@ -5,7 +5,7 @@ from collections.abc import Sequence
 
 import torch
 
-from ....data.image import ScalarImage
+from ....data.image import Image
 from ....data.subject import Subject
 from ....transforms.transform import TypeMaskingMethod
 from ...intensity_transform import IntensityTransform
@@ -69,15 +69,31 @@ class Mask(IntensityTransform):
                 image.data,
                 self.masking_labels,
             )
-            assert isinstance(image, ScalarImage)
             self.apply_masking(image, mask_data)
         return subject
 
     def apply_masking(
         self,
-        image: ScalarImage,
+        image: Image,
         mask_data: torch.Tensor,
     ) -> None:
+        num_channels_image = image.data.shape[0]
+        num_channels_mask = mask_data.shape[0]
+        if num_channels_image != num_channels_mask:
+            assert num_channels_mask == 1
+            message = (
+                f'Expanding mask with shape {mask_data.shape}'
+                f' to match shape {image.data.shape} of input image'
+            )
+            warnings.warn(message, RuntimeWarning, stacklevel=2)
+        # Boolean and on the same device as the image, so that the masking
+        # kernel does not need implicit casts or copies. Copies to the host
+        # must block, as the masking kernel would not wait for them
+        mask_data = mask_data.to(
+            device=image.data.device,
+            dtype=torch.bool,
+            non_blocking=image.data.is_cuda,
+        )
         masked = mask(image.data, mask_data, self.outside_value)
         image.set_data(masked)
 
@@ -87,16 +103,11 @@ def mask(
     mask: torch.Tensor,
     outside_value: float,
 ) -> torch.Tensor:
-    array = tensor.clone()
-    num_channels_array = array.shape[0]
-    num_channels_mask = mask.shape[0]
-    if num_channels_array != num_channels_mask:
-        assert num_channels_mask == 1
-        message = (
-            f'Expanding mask with shape {mask.shape}'
-            f' to match shape {array.shape} of input image'
-        )
-        warnings.warn(message, RuntimeWarning, stacklevel=2)
-        mask = mask.expand(*array.shape)
-    array[~mask] = outside_value
-    return array
+    # Pure tensor operations only, so that this can be compiled without breaks
+    if mask.dtype != torch.bool:
+        mask = mask.to(torch.bool)
+    # Filled on the device, unlike torch.tensor, which copies from the host
+    outside = tensor.new_full((), outside_value)
+    # A single pass over the data; the mask is broadcast along channels.
+    # Multiplying by the mask would be wrong for non-finite values outside it
+    return torch.where(mask, tensor, outside)
@@ -82,9 +82,6 @@ class Crop(BoundsTransform):
                         index_fin,
                         copy_patch=self._copy_patch,
                     )
-
-            # Update the __dict__ attribute to include the cropped images
-            cropped_subject.update_attributes()
             return cropped_subject
         else:
             # Crop in place
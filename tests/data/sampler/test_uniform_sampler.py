@@ -24,3 +24,41 @@ class TestUniformSampler(TorchioTestCase):
         patch_size = 2
         sampler = UniformSampler(patch_size)
         next(sampler(subject))
+
+    def test_num_patches(self):
+        patch_size = 3
+        sampler = UniformSampler(patch_size)
+        patches = list(sampler(self.sample_subject, num_patches=5))
+        assert len(patches) == 5
+        for patch in patches:
+            assert patch.spatial_shape == (patch_size, patch_size, patch_size)
+
+    def test_reproducible(self):
+        sampler = UniformSampler(3)
+
+        def get_locations():
+            torch.manual_seed(0)
+            patches = sampler(self.sample_subject, num_patches=5)
+            return [patch[torchio.LOCATION].tolist() for patch in patches]
+
+        assert get_locations() == get_locations()
+
+    def test_num_patches_larger_than_chunk(self):
+        sampler = UniformSampler(3)
+        sampler.chunk_size = 2
+        patches = list(sampler(self.sample_subject, num_patches=5))
+        assert len(patches) == 5
+
+    def test_infinite(self):
+        patch_size = 3
+        sampler = UniformSampler(patch_size)
+        sampler.chunk_size = 2
+        patches = sampler(self.sample_subject)
+        shape = self.sample_subject.spatial_shape
+        for _ in range(5):  # more than two chunks
+            patch = next(patches)
+            assert patch.spatial_shape == (patch_size, patch_size, patch_size)
+            location = patch[torchio.LOCATION].tolist()
+            index_ini, index_fin = location[:3], location[3:]
+            assert all(i >= 0 for i in index_ini)
+            assert all(f <= s for f, s in zip(index_fin, shape))
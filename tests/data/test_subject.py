@@ -135,6 +135,94 @@ class TestSubject(TorchioTestCase):
         with pytest.raises(AttributeError):
             _ = subject.t1
 
+    def test_images_cache_invalidated(self):
+        subject = copy.deepcopy(self.sample_subject)
+        names = subject.get_images_names()
+        image = tio.ScalarImage(tensor=torch.rand(1, 10, 20, 30))
+        subject['new'] = image
+        assert subject.get_images_names() == [*names, 'new']
+        assert subject.get_images(intensity_only=True)[-1] is image
+        subject.pop('new')
+        assert subject.get_images_names() == names
+
+    def test_crop_item_not_in_attributes(self):
+        image = tio.ScalarImage(tensor=torch.rand(1, 4, 4, 4))
+        subject = tio.Subject(a=image)
+        dict.__setitem__(subject, 'd', copy.deepcopy(image))
+        subject.get_images()
+        cropped = tio.Crop(1)(subject)
+        for cropped_image in cropped.get_images(intensity_only=False):
+            assert cropped_image.spatial_shape == (2, 2, 2)
+
+    def test_images_cache_added_through_dict(self):
+        subject = copy.deepcopy(self.sample_subject)
+        names = subject.get_images_names()
+        image = tio.ScalarImage(tensor=torch.rand(1, 10, 20, 30))
+        dict.update(subject, new=image)
+        assert subject.get_images_names() == [*names, 'new']
+
+    def test_images_cache_type_changed(self):
+        subject = copy.deepcopy(self.sample_subject)
+        assert 'label' not in subject.get_images_dict(intensity_only=True)
+        subject.label[tio.TYPE] = tio.INTENSITY
+        assert 'label' in subject.get_images_dict(intensity_only=True)
+
+    def test_images_cache_not_in_attributes(self):
+        subject = copy.deepcopy(self.sample_subject)
+        subject.get_images_names()
+        assert set(vars(subject)) == {*subject.keys(), 'applied_transforms'}
+
+    def test_stale_images_cache(self):
+        subject = copy.deepcopy(self.sample_subject)
+        subject.get_images_names()
+        dict.__delitem__(subject, 't1')
+        assert 't1' not in subject.get_images_names()
+
+    def test_item_attribute_sync(self):
+        subject = copy.deepcopy(self.sample_subject)
+        image = tio.ScalarImage(tensor=torch.rand(1, 10, 20, 30))
+        subject['new'] = image
+        assert subject.new is image
+        del subject['new']
+        assert not hasattr(subject, 'new')
+
+    def test_update_pop_attribute_sync(self):
+        subject = copy.deepcopy(self.sample_subject)
+        image = tio.ScalarImage(tensor=torch.rand(1, 10, 20, 30))
+        subject.update(new=image)
+        assert subject.new is image
+        assert subject.pop('new') is image
+        assert not hasattr(subject, 'new')
+
+    def test_ior_attribute_sync(self):
+        subject = copy.deepcopy(self.sample_subject)
+        names = subject.get_images_names()
+        image = tio.ScalarImage(tensor=torch.rand(1, 10, 20, 30))
+        subject |= {'new': image}
+        assert subject.new is image
+        assert subject.get_images_names() == [*names, 'new']
+
+    def test_indexing(self):
+        subject = copy.deepcopy(self.sample_subject)
+        subject['age'] = 45
+        cropped = subject[2:5, :, 3]
+        assert cropped.spatial_shape == (3, *subject.spatial_shape[1:2], 1)
+        assert cropped.t1.spatial_shape == cropped.spatial_shape
+        assert cropped['age'] == 45
+        assert subject.spatial_shape == self.sample_subject.spatial_shape
+
+    def test_indexing_copies(self):
+        subject = copy.deepcopy(self.sample_subject)
+        subject['location'] = torch.zeros(3)
+        subject.applied_transforms.append(('Noise', {'std': 1}))
+        cropped = subject[2:5]
+        cropped['location'] += 1
+        cropped.applied_transforms[0][1]['std'] = 2
+        assert subject['location'].sum() == 0
+        assert subject.location is subject['location']
+        assert cropped.location is cropped['location']
+        assert subject.applied_transforms[0][1]['std'] == 1
+
     def test_2d(self):
         subject = self.make_2d(self.sample_subject)
         assert subject.is_2d()
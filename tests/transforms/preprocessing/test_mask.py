@@ -69,3 +69,37 @@ class TestMask(TorchioTestCase):
         with pytest.warns(RuntimeWarning, match='^Expanding.*'):
             masked = transform(subject)
         assert masked.image.shape == image.shape
+
+    def test_dtype_preserved(self):
+        image = tio.ScalarImage(tensor=torch.arange(6).reshape(1, 1, 2, 3))
+        mask = tio.LabelMap(tensor=torch.tensor([0, 1, 1, 0, 1, 0]).reshape(1, 1, 2, 3))
+        subject = tio.Subject(image=image, mask_lm=mask)
+        transform = tio.Mask(masking_method='mask_lm', outside_value=-1)
+        masked = transform(subject)
+        assert masked.image.data.dtype == image.data.dtype
+        assert masked.image.data.flatten().tolist() == [-1, 1, 2, -1, 4, -1]
+
+    def test_non_finite_outside(self):
+        tensor = torch.tensor([1, float('nan'), float('inf'), 4]).reshape(1, 1, 1, 4)
+        mask = torch.tensor([1, 0, 0, 1]).reshape(1, 1, 1, 4)
+        subject = tio.Subject(
+            image=tio.ScalarImage(tensor=tensor),
+            mask_lm=tio.LabelMap(tensor=mask),
+        )
+        masked = tio.Mask(masking_method='mask_lm')(subject)
+        assert masked.image.data.flatten().tolist() == [1, 0, 0, 4]
+
+    def test_full_mask(self):
+        image = tio.ScalarImage(tensor=torch.rand(1, 2, 3, 4))
+        mask = tio.LabelMap(tensor=torch.ones(1, 2, 3, 4))
+        subject = tio.Subject(image=image, mask_lm=mask)
+        masked = tio.Mask(masking_method='mask_lm')(subject)
+        assert torch.equal(masked.image.data, image.data)
+        assert masked.image.data is not image.data
+
+    def test_intensity_image(self):
+        image = tio.Image(tensor=torch.rand(1, 2, 3, 4), type=tio.INTENSITY)
+        mask = tio.LabelMap(tensor=torch.zeros(1, 2, 3, 4))
+        subject = tio.Subject(image=image, mask_lm=mask)
+        masked = tio.Mask(masking_method='mask_lm')(subject)
+        assert (masked.image.data == 0).all()